@@ -3,16 +3,88 @@
 #!/usr/bin/env python3
 
 import argparse
+import hashlib
+import io
+import multiprocessing
 import os
+import pickle
 import sys
 import shutil
+import subprocess
 import time
-from pathlib import Path
-from typing import List
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
 
-import colorama
 import pathspec
-import pyperclip
+
+# Set by main() when stdout is a terminal
+_USE_COLOR = False
+
+# colorama's Fore and Style, bound by main() together with _USE_COLOR
+_FORE: Any = None
+_STYLE: Any = None
+
+# Directory scans are I/O-bound, so allow more threads than cores
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Maximum number of file reads in flight, bounding open file descriptors
+_READ_AHEAD = 64
+
+# With --parallel, file matching moves to a process pool above this many files
+_PARALLEL_MATCH_THRESHOLD = 10_000
+_PARALLEL_MATCH_CHUNK = 1000
+
+# Spec of a --parallel match worker process, set once by _init_match_worker()
+_worker_spec: Optional['FastSpec'] = None
+
+# Extensions classified without looking at the file contents
+_BINARY_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.pdf', '.zip', '.gz', '.tar', '.bz2', '.xz', '.7z', '.so',
+    '.dylib', '.dll', '.exe', '.pyc', '.whl', '.mp4', '.mov', '.webp', '.ico', '.ttf', '.woff', '.woff2',
+})
+_TEXT_EXTS = frozenset({
+    '.py', '.md', '.txt', '.json', '.yaml', '.yml', '.toml', '.rs', '.go', '.c', '.h', '.cpp', '.hpp',
+    '.js', '.ts', '.tsx', '.jsx', '.html', '.css',
+})
+
+# Largest output (in characters) kept for the clipboard when also writing a file
+_CLIPBOARD_MAX_CHARS = 5 * 1024 * 1024
+
+# Ignore patterns applied on top of .gitignore
+_DEFAULT_IGNORE_PATTERNS = [
+    '.git/',
+    '.svn/',
+    '.hg/',
+    '.DS_Store',
+    '__pycache__/',
+    '*.pyc',
+    '*.pyo',
+    '*.pyd',
+    '*$py.class',
+    '*.so',
+    'build/',
+    'dist/',
+    'downloads/',
+    'eggs/',
+    '.eggs/',
+    'lib/',
+    'lib64/',
+    'parts/',
+    'sdist/',
+]
+
+# Directory names ignored by the defaults at any depth. The defaults come
+# after .gitignore, so no negation can re-include these.
+_DIR_BASENAME_SKIP = frozenset(pattern[:-1] for pattern in _DEFAULT_IGNORE_PATTERNS if pattern.endswith('/'))
+
+# Bump when FastSpec's pickled layout changes so old cache entries are ignored
+_SPEC_CACHE_FORMAT = 1
+
+# Characters that make a gitignore pattern more than a literal name
+_GLOB_CHARS = frozenset('*?[\\')
 
 
 def main() -> None:
@@ -21,13 +93,19 @@ def main() -> None:
     Converts a repository into an LLM-friendly text format,
     copies it to the clipboard, and optionally writes it to a file.
     """
-    # Initialize colorama
-    colorama.init(autoreset=True)
+    global _USE_COLOR, _FORE, _STYLE
 
     # Parse command-line arguments
     parser = setup_argparser()
     args = parser.parse_args()
 
+    # Color only interactive output; piped output stays plain
+    if sys.stdout.isatty():
+        import colorama
+        colorama.init(autoreset=True)
+        _FORE, _STYLE = colorama.Fore, colorama.Style
+        _USE_COLOR = True
+
     root_dir = args.root_dir
 
     if not os.path.isdir(root_dir):
@@ -40,23 +118,21 @@ def main() -> None:
     start_time = time.time()
 
     # Load .gitignore and combined ignore patterns
-    spec = load_gitignore()
-
-    # Build project tree
-    tree = build_project_tree(spec=spec)
+    spec = load_gitignore(use_cache=args.cache)
 
-    # Collect files to include
-    files = collect_files(spec=spec)
+    # Build project tree and collect files to include in a single pass
+    tree_lines, files = walk_repo(spec=spec, parallel=args.parallel)
+    tree = '\n'.join(tree_lines)
 
-    # Build the final string to copy
-    final_string = build_final_string(tree, files)
+    # Optionally stream the output to a file, otherwise build it in memory
+    if args.output:
+        final_string = write_output_file(iter_final_chunks(tree, files), args.output)
+    else:
+        final_string = build_final_string(tree, files)
 
     # Copy to clipboard
-    copy_to_clipboard(final_string)
-
-    # Optionally write to an output file
-    if args.output:
-        write_output_file(final_string, args.output)
+    if final_string is not None:
+        copy_to_clipboard(final_string)
 
     end_time = time.time()
     duration = end_time - start_time
@@ -84,217 +160,545 @@ def setup_argparser() -> argparse.ArgumentParser:
         '--output',
         help='Output file to save the formatted repository (optional)'
     )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Match file paths against ignore patterns on multiple processes for very large repositories'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Cache the parsed ignore patterns in the user cache directory'
+    )
     return parser
 
 
-def load_gitignore() -> pathspec.PathSpec:
+class FastSpec:
+    """
+    Ignore spec that answers the common gitignore pattern shapes with set
+    and string checks, falling back to pathspec for everything else.
+
+    Patterns without a slash are split into literal names (e.g. '.DS_Store'),
+    literal directory names (e.g. 'build/') and simple suffixes (e.g. '*.pyc'),
+    which match any component of a path. If any pattern is negated, pattern
+    order matters, so all patterns are left to pathspec.
+    """
+
+    def __init__(self, lines: List[str]) -> None:
+        """
+        Partitions the given gitignore lines into fast paths and a fallback spec.
+
+        Args:
+            lines (List[str]): Gitignore pattern lines, in order.
+        """
+        patterns = [line.rstrip('\r\n') for line in lines]
+        names = set()
+        dir_names = set()
+        suffixes = set()
+        fallback: List[str] = []
+
+        if any(pattern.startswith('!') for pattern in patterns):
+            fallback = patterns
+        else:
+            for pattern in patterns:
+                if not pattern or pattern.startswith('#'):
+                    continue
+                dir_only = pattern.endswith('/')
+                body = pattern[:-1] if dir_only else pattern
+                if not body or body != body.strip() or '/' in body or body in ('.', '..'):
+                    fallback.append(pattern)
+                elif _GLOB_CHARS.isdisjoint(body):
+                    (dir_names if dir_only else names).add(body)
+                elif body[0] == '*' and len(body) > 1 and _GLOB_CHARS.isdisjoint(body[1:]) and not dir_only:
+                    suffixes.add(body[1:])
+                else:
+                    fallback.append(pattern)
+
+        self._names = frozenset(names)
+        self._dir_names = frozenset(dir_names)
+        self._suffixes = tuple(sorted(suffixes))
+        self._fallback = pathspec.PathSpec.from_lines('gitwildmatch', fallback) if fallback else None
+
+    def match_file(self, file: str) -> bool:
+        """
+        Checks whether a path is ignored. Directory paths end with '/'.
+
+        Paths must already be normalized and relative to the repository root,
+        as the walker builds them: no '.' or '..' components, no repeated or
+        leading separators. Only a single leading './' is stripped. The fast
+        paths compare raw path components, so unnormalized paths can give a
+        different answer than pathspec would.
+
+        Args:
+            file (str): Normalized relative path to check.
+
+        Returns:
+            bool: True if the path is ignored, False otherwise.
+        """
+        path = file.replace(os.sep, '/') if os.sep != '/' else file
+        if path.startswith('./'):
+            path = path[2:]
+        parts = path.split('/')
+        if self._names and not self._names.isdisjoint(parts):
+            return True
+        if self._dir_names and not self._dir_names.isdisjoint(parts[:-1]):
+            return True
+        if self._suffixes:
+            for part in parts:
+                if part.endswith(self._suffixes):
+                    return True
+        if self._fallback is not None:
+            return self._fallback.match_file(path)
+        return False
+
+
+def load_gitignore(use_cache: bool = False) -> FastSpec:
     """
     Loads the .gitignore file and combines it with default ignore patterns.
+    Optionally caches the combined spec on disk, one entry per .gitignore
+    path, reused while its modification time and size are unchanged.
+
+    Args:
+        use_cache (bool): Whether to read and write the on-disk cache.
 
     Returns:
-        pathspec.PathSpec: Combined ignore patterns.
-    """
-    default_ignore_patterns = [
-        '.git/',
-        '.svn/',
-        '.hg/',
-        '.DS_Store',
-        '__pycache__/',
-        '*.pyc',
-        '*.pyo',
-        '*.pyd',
-        '*$py.class',
-        '*.so',
-        'build/',
-        'dist/',
-        'downloads/',
-        'eggs/',
-        '.eggs/',
-        'lib/',
-        'lib64/',
-        'parts/',
-        'sdist/',
-    ]
-
-    if os.path.exists('.gitignore'):
-        with open('.gitignore', 'r', encoding='utf-8') as gitignore_file:
-            gitignore_lines = gitignore_file.readlines()
-        if not gitignore_lines:
-            print_warning("Alert: .gitignore is empty.")
-        gitignore_spec = pathspec.PathSpec.from_lines('gitwildmatch', gitignore_lines)
-    else:
+        FastSpec: Combined ignore patterns.
+    """
+    if not os.path.exists('.gitignore'):
         print_warning("Alert: .gitignore file not found. Using default ignore patterns.")
-        gitignore_spec = pathspec.PathSpec.from_lines('gitwildmatch', [])
+        return FastSpec(_DEFAULT_IGNORE_PATTERNS)
+
+    gitignore_stat = os.stat('.gitignore')
+    if gitignore_stat.st_size == 0:
+        print_warning("Alert: .gitignore is empty.")
+
+    if use_cache:
+        cache_path = _spec_cache_path()
+        cache_key = _spec_cache_key(gitignore_stat)
+        cached_spec = _load_cached_spec(cache_path, cache_key)
+        if cached_spec is not None:
+            return cached_spec
+
+    with open('.gitignore', 'r', encoding='utf-8') as gitignore_file:
+        gitignore_lines = gitignore_file.readlines()
 
     # Combine .gitignore with default ignore patterns
-    default_spec = pathspec.PathSpec.from_lines('gitwildmatch', default_ignore_patterns)
-    combined_spec = gitignore_spec + default_spec
+    combined_spec = FastSpec(gitignore_lines + _DEFAULT_IGNORE_PATTERNS)
+    if use_cache:
+        _store_cached_spec(cache_path, cache_key, combined_spec)
     return combined_spec
 
 
-def build_project_tree(spec: pathspec.PathSpec) -> str:
+def _spec_cache_path() -> str:
     """
-    Builds a hierarchical project tree excluding ignored files and directories.
+    Builds the cache file path for the current .gitignore. The name depends
+    only on the .gitignore path, so each repository overwrites its own entry.
+
+    Returns:
+        str: Path of the cache file.
+    """
+    if sys.platform == 'win32':
+        cache_root = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        cache_root = os.path.expanduser('~/Library/Caches')
+    else:
+        cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+
+    digest = hashlib.blake2b(os.path.abspath('.gitignore').encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(cache_root, 'repo2text', f"{digest}.pkl")
+
+
+def _spec_cache_key(gitignore_stat: os.stat_result) -> Tuple[object, ...]:
+    """
+    Builds the key a cache entry must match to be reused. It covers the
+    .gitignore contents (by mtime and size) and everything that shapes the
+    pickled spec, so upgrades never reuse an incompatible entry.
 
     Args:
-        spec (pathspec.PathSpec): Combined ignore patterns.
+        gitignore_stat (os.stat_result): Result of os.stat on .gitignore.
 
     Returns:
-        str: Project tree as a string.
+        Tuple[object, ...]: Cache key.
     """
-    tree: List[str] = []
-    for root, dirs, files in os.walk('.'):
-        # Exclude ignored directories
-        dirs[:] = [
-            d for d in dirs
-            if not spec.match_file(os.path.normpath(os.path.join(os.path.relpath(root, '.'), d)) + '/')
-        ]
+    return (
+        _SPEC_CACHE_FORMAT,
+        pathspec.__version__,
+        tuple(_DEFAULT_IGNORE_PATTERNS),
+        gitignore_stat.st_mtime_ns,
+        gitignore_stat.st_size,
+    )
 
-        # Determine the indentation level
-        rel_path = os.path.relpath(root, '.')
-        if rel_path == '.':
-            level = 0
-        else:
-            level = rel_path.count(os.sep) + 1
 
-        indent = ' ' * 4 * level
-        directory = os.path.basename(root) if rel_path != '.' else '.'
-        tree.append(f"{indent}{directory}/")
+def _load_cached_spec(cache_path: str, cache_key: Tuple[object, ...]) -> Optional[FastSpec]:
+    """
+    Loads a cached spec, ignoring a missing, unreadable or stale cache file.
 
-        # Add files to the tree
-        subindent = ' ' * 4 * (level + 1)
-        for file in sorted(files):
-            rel_file_path = os.path.normpath(os.path.join(os.path.relpath(root, '.'), file))
-            if not spec.match_file(rel_file_path) and Path(rel_file_path).name != '.gitignore':
-                tree.append(f"{subindent}{file}")
+    Args:
+        cache_path (str): Path of the cache file.
+        cache_key (Tuple[object, ...]): Key the entry must match.
 
-    return '\n'.join(tree)
+    Returns:
+        Optional[FastSpec]: The cached spec, or None on a cache miss.
+    """
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            # The key is stored first so a stale spec is never unpickled
+            if pickle.load(cache_file) != cache_key:
+                return None
+            spec = pickle.load(cache_file)
+    except Exception:
+        return None
+    return spec if isinstance(spec, FastSpec) else None
+
+
+def _store_cached_spec(cache_path: str, cache_key: Tuple[object, ...], spec: FastSpec) -> None:
+    """
+    Stores a spec in the cache. Failures are ignored since the cache is optional.
+
+    Args:
+        cache_path (str): Path of the cache file.
+        cache_key (Tuple[object, ...]): Key the entry is valid for.
+        spec (FastSpec): Spec to store.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as cache_file:
+            pickle.dump(cache_key, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(spec, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        # Replace atomically so concurrent runs never read a partial file
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
-def collect_files(spec: pathspec.PathSpec) -> List[str]:
+def walk_repo(spec: FastSpec, parallel: bool = False) -> Tuple[List[str], List[str]]:
     """
-    Collects all non-ignored files, excluding .gitignore.
+    Walks the repository once, building the project tree and the list of
+    files to include in a single pass. Directories are scanned concurrently
+    and the results are sorted once at the end.
 
     Args:
-        spec (pathspec.PathSpec): Combined ignore patterns.
+        spec (FastSpec): Combined ignore patterns.
+        parallel (bool): Defer file matching and, for very large repositories,
+            run it on a process pool.
 
     Returns:
-        List[str]: List of file paths to include.
+        Tuple[List[str], List[str]]: Project tree lines and file paths to include.
     """
-    files_to_include: List[str] = []
-    for root, dirs, files in os.walk('.'):
-        # Exclude ignored directories
-        dirs[:] = [
-            d for d in dirs
-            if not spec.match_file(os.path.normpath(os.path.join(os.path.relpath(root, '.'), d)) + '/')
-        ]
+    dirs_out: List[str] = ['']
+    files_out: List[Tuple[str, str]] = []
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        pending = {executor.submit(_scan_dir, '.', '', spec, not parallel): ''}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel_prefix = pending.pop(future)
+                names, subdirs = future.result()
+                files_out.extend((rel_prefix, name) for name in names)
+                for sub_path, sub_prefix in subdirs:
+                    dirs_out.append(sub_prefix)
+                    pending[executor.submit(_scan_dir, sub_path, sub_prefix, spec, not parallel)] = sub_prefix
+
+    if parallel:
+        files_out = _match_files(spec, files_out)
+
+    # Sort everything once; comparing path components keeps each
+    # directory's subtree together, files before subdirectories
+    dirs_out.sort(key=lambda rel_prefix: rel_prefix.split(os.sep))
+    files_out.sort(key=lambda item: (item[0].split(os.sep), item[1]))
+    names_by_dir = {
+        rel_prefix: [name for _, name in group]
+        for rel_prefix, group in groupby(files_out, key=itemgetter(0))
+    }
 
-        for file in sorted(files):
-            rel_file_path = os.path.normpath(os.path.join(os.path.relpath(root, '.'), file))
-            if not spec.match_file(rel_file_path) and Path(rel_file_path).name != '.gitignore':
-                files_to_include.append(rel_file_path)
+    tree: List[str] = []
+    files_to_include: List[str] = []
+    for rel_prefix in dirs_out:
+        level = rel_prefix.count(os.sep)
+        directory = os.path.basename(rel_prefix[:-1]) if rel_prefix else '.'
+        tree.append(f"{' ' * 4 * level}{directory}/")
+        subindent = ' ' * 4 * (level + 1)
+        for name in names_by_dir.get(rel_prefix, ()):
+            tree.append(f"{subindent}{name}")
+            files_to_include.append(rel_prefix + name)
 
-    return files_to_include
+    return tree, files_to_include
 
 
-def is_binary_file(file_path: str) -> bool:
+def _scan_dir(
+    dir_path: str,
+    rel_prefix: str,
+    spec: FastSpec,
+    match_files: bool = True,
+) -> Tuple[List[str], List[Tuple[str, str]]]:
     """
-    Determines if a file is binary by checking for null bytes.
+    Scans a single directory with os.scandir. Entry types come from the
+    directory listing itself, so no extra stat call is needed per entry.
 
     Args:
-        file_path (str): Path to the file.
+        dir_path (str): Path of the directory to scan.
+        rel_prefix (str): Relative path prefix of the directory ('' for the root).
+        spec (FastSpec): Combined ignore patterns.
+        match_files (bool): Whether to match files here; directories are always matched.
 
     Returns:
-        bool: True if binary, False otherwise.
+        Tuple[List[str], List[Tuple[str, str]]]: Names of the files to include,
+        and the path and relative prefix of each non-ignored subdirectory, unsorted.
     """
+    names: List[str] = []
+    subdirs: List[Tuple[str, str]] = []
     try:
-        with open(file_path, 'rb') as file:
-            chunk = file.read(1024)
-            if b'\0' in chunk:
-                return True
-    except Exception:
-        # If the file cannot be read, consider it binary to omit it
-        return True
-    return False
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does
+        return names, subdirs
+
+    for entry in entries:
+        # Build each relative path once and reuse it for matching and recursion
+        rel_path = rel_prefix + entry.name
+        # Only regular files (and symlinks to them) are listed. Broken symlinks,
+        # symlinked directories, FIFOs, sockets and device files are left out;
+        # opening a FIFO would block the run. Entries whose type cannot be
+        # determined (symlink loops, targets that cannot be stat'ed) are
+        # skipped rather than aborting the walk.
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            is_file = not is_dir and entry.is_file()
+        except OSError:
+            continue
+
+        if is_dir:
+            # Exclude ignored directories, skipping pattern matching for default ones
+            if entry.name not in _DIR_BASENAME_SKIP and not spec.match_file(rel_path + '/'):
+                subdirs.append((entry.path, rel_path + os.sep))
+        elif is_file:
+            # Compare the name first so .gitignore skips pattern matching
+            if entry.name != '.gitignore' and not (match_files and spec.match_file(rel_path)):
+                names.append(entry.name)
+
+    return names, subdirs
+
+
+def _match_files(spec: FastSpec, files: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Drops ignored files, spreading the matching over a process pool when
+    there are enough files to amortize starting the workers.
 
+    Args:
+        spec (FastSpec): Combined ignore patterns.
+        files (List[Tuple[str, str]]): Relative directory prefix and name of each file.
 
-def build_final_string(tree: str, files: List[str]) -> str:
+    Returns:
+        List[Tuple[str, str]]: The files that are not ignored, in their original order.
     """
-    Builds the final formatted string containing the project tree and file contents.
+    if len(files) <= _PARALLEL_MATCH_THRESHOLD:
+        return _match_chunk(spec, files)
+
+    chunks = [files[i:i + _PARALLEL_MATCH_CHUNK] for i in range(0, len(files), _PARALLEL_MATCH_CHUNK)]
+    kept: List[Tuple[str, str]] = []
+    # The spec is sent to each worker once, not with every chunk
+    with multiprocessing.Pool(initializer=_init_match_worker, initargs=(spec,)) as pool:
+        for chunk in pool.imap(_match_chunk_in_worker, chunks):
+            kept.extend(chunk)
+    return kept
+
+
+def _init_match_worker(spec: FastSpec) -> None:
+    """
+    Stores the spec in a match worker process.
 
     Args:
-        tree (str): Project tree.
-        files (List[str]): List of files to include.
+        spec (FastSpec): Combined ignore patterns.
+    """
+    global _worker_spec
+    _worker_spec = spec
+
+
+def _match_chunk_in_worker(files: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Drops ignored files from a chunk of files using the worker's spec.
+
+    Args:
+        files (List[Tuple[str, str]]): Relative directory prefix and name of each file.
 
     Returns:
-        str: Final formatted string.
+        List[Tuple[str, str]]: The files that are not ignored.
     """
-    output: List[str] = []
-    output.append("Project Tree:")
-    output.append(tree)
-    output.append("")
+    return _match_chunk(_worker_spec, files)
 
-    for file in files:
-        # Console Output with color and header ###
-        print_header(file)
-        print_code_block_indicator()
 
-        # Build string without color
-        header = f"### File: {file}\n### Code block below:\n"
-        output.append(header)
+def _match_chunk(spec: FastSpec, files: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Drops ignored files from a chunk of files.
 
-        if is_binary_file(file):
-            message = "(Binary file omitted)"
-            print_warning(message)
-            output.append(f"{message}\n")
-        else:
-            try:
-                with open(file, 'r', encoding='utf-8', errors='replace') as f:
-                    lines = f.readlines()
-                    if not lines:
-                        message = "(Empty file)"
-                        print_warning(message)
-                        output.append(f"{message}\n")
-                    else:
-                        # Truncate to first 20 lines for display
-                        truncated_content = ''.join(lines[:20]).rstrip('\n')
-                        output.append(f"{''.join(lines)}\n")
-                        print_truncated_content(truncated_content)
-            except Exception as e:
-                message = f"(Could not read file: {e})"
-                print_error(message)
-                output.append(f"{message}\n")
-        print()  # Add an empty line for better readability
+    Args:
+        spec (FastSpec): Combined ignore patterns.
+        files (List[Tuple[str, str]]): Relative directory prefix and name of each file.
 
-    final_output = '\n'.join(output)
-    return final_output
+    Returns:
+        List[Tuple[str, str]]: The files that are not ignored.
+    """
+    return [(rel_prefix, name) for rel_prefix, name in files if not spec.match_file(rel_prefix + name)]
 
 
-def print_header(file: str) -> None:
+def build_project_tree(spec: FastSpec) -> str:
     """
-    Prints the file header with color.
+    Builds a hierarchical project tree excluding ignored files and directories.
 
     Args:
-        file (str): File path.
+        spec (FastSpec): Combined ignore patterns.
+
+    Returns:
+        str: Project tree as a string.
     """
-    print(f"{colorama.Fore.GREEN}### File: {file}{colorama.Style.RESET_ALL}")
+    tree, _ = walk_repo(spec)
+    return '\n'.join(tree)
 
 
-def print_code_block_indicator() -> None:
+def read_file_for_output(file_path: str) -> Tuple[bool, str]:
     """
-    Prints the code block indicator with color.
+    Reads a file with a single open, detecting binary content by checking
+    the first 1024 bytes for null bytes before reading the whole file.
+    Well-known text extensions skip the check, and known binary files are
+    not opened at all.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        Tuple[bool, str]: Whether the file is binary, and its decoded
+        content ('' for binary files).
     """
-    print(f"{colorama.Fore.MAGENTA}### Code block below:{colorama.Style.RESET_ALL}")
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in _BINARY_EXTS:
+        return True, ''
+    with open(file_path, 'rb') as file:
+        if extension not in _TEXT_EXTS:
+            # Sniff the first 1024 bytes so binary files are never loaded in full.
+            # A 1 KiB read is a single syscall and a buffer no larger than the
+            # slice it replaces; mmap would need fstat, mmap and munmap, and
+            # text files are read in full right after anyway.
+            if b'\0' in file.read(1024):
+                return True, ''
+            # Re-read the prefix from the page cache rather than copying the
+            # whole file to join it onto the prefix
+            file.seek(0)
+        data = file.read()
+    content = data.decode('utf-8', errors='replace')
+    if '\r' in content:
+        # Match the universal newline handling of text mode
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return False, content
+
+
+def _read_ahead(files: List[str]) -> Iterator[Tuple[str, 'Future[Tuple[bool, str]]']]:
+    """
+    Reads files on a thread pool, keeping a bounded number of reads in flight.
 
+    Args:
+        files (List[str]): List of files to read.
 
-def print_truncated_content(content: str) -> None:
+    Yields:
+        Tuple[str, Future]: Each file path with the future of its contents, in order.
     """
-    Prints the truncated content with color.
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        pending: Deque[Tuple[str, 'Future[Tuple[bool, str]]']] = deque()
+        for file in files:
+            pending.append((file, executor.submit(read_file_for_output, file)))
+            if len(pending) >= _READ_AHEAD:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+def iter_final_chunks(tree: str, files: List[str]) -> Iterator[str]:
+    """
+    Yields the final formatted output, containing the project tree and file
+    contents, in chunks so it can be streamed without building one string.
 
     Args:
-        content (str): Truncated file content.
+        tree (str): Project tree.
+        files (List[str]): List of files to include.
+
+    Yields:
+        str: Consecutive chunks of the final output.
     """
-    print(f"{colorama.Fore.WHITE}{content}...\n{colorama.Style.RESET_ALL}")
+    yield "Project Tree:\n"
+    yield tree
+    yield "\n"
+
+    for file, future in _read_ahead(files):
+        # Console output is collected per file and written in one call
+        console = [
+            _colored(f"### File: {file}", 'GREEN'),
+            _colored("### Code block below:", 'MAGENTA'),
+        ]
+
+        # Build string without color; each block is separated by a newline
+        yield f"\n### File: {file}\n### Code block below:\n"
+
+        try:
+            is_binary, content = future.result()
+        except Exception as e:
+            message = f"(Could not read file: {e})"
+            console.append(_colored(message, 'RED'))
+            yield f"\n{message}\n"
+        else:
+            if is_binary:
+                message = "(Binary file omitted)"
+                console.append(_colored(message, 'YELLOW'))
+                yield f"\n{message}\n"
+            elif not content:
+                message = "(Empty file)"
+                console.append(_colored(message, 'YELLOW'))
+                yield f"\n{message}\n"
+            else:
+                # Truncate to first 20 lines for display, splitting no further than needed
+                truncated_content = '\n'.join(content.split('\n', 20)[:20]).rstrip('\n')
+                yield "\n"
+                yield content
+                yield "\n"
+                console.append(_colored(f"{truncated_content}...\n", 'WHITE'))
+        # End with an empty line for better readability
+        sys.stdout.write('\n'.join(console) + '\n\n')
+
+
+def build_final_string(tree: str, files: List[str]) -> str:
+    """
+    Builds the final formatted string containing the project tree and file contents.
+
+    Args:
+        tree (str): Project tree.
+        files (List[str]): List of files to include.
+
+    Returns:
+        str: Final formatted string.
+    """
+    buf = io.StringIO()
+    for chunk in iter_final_chunks(tree, files):
+        buf.write(chunk)
+    return buf.getvalue()
+
+
+def _colored(message: str, color: str) -> str:
+    """
+    Wraps a message in the given color when color output is enabled.
+
+    Args:
+        message (str): Message to color.
+        color (str): Name of the colorama foreground color, e.g. 'GREEN'.
+
+    Returns:
+        str: Colored message, or the message unchanged.
+    """
+    if not _USE_COLOR:
+        return message
+    return f"{getattr(_FORE, color)}{message}{_STYLE.RESET_ALL}"
 
 
 def print_warning(message: str) -> None:
@@ -304,7 +708,7 @@ def print_warning(message: str) -> None:
     Args:
         message (str): Warning message.
     """
-    print(f"{colorama.Fore.YELLOW}{message}{colorama.Style.RESET_ALL}")
+    print(_colored(message, 'YELLOW'))
 
 
 def print_error(message: str) -> None:
@@ -314,7 +718,7 @@ def print_error(message: str) -> None:
     Args:
         message (str): Error message.
     """
-    print(f"{colorama.Fore.RED}{message}{colorama.Style.RESET_ALL}")
+    print(_colored(message, 'RED'))
 
 
 def print_info(message: str) -> None:
@@ -324,34 +728,89 @@ def print_info(message: str) -> None:
     Args:
         message (str): Informational message.
     """
-    print(f"{colorama.Fore.CYAN}{message}{colorama.Style.RESET_ALL}")
+    print(_colored(message, 'CYAN'))
+
+
+def _clipboard_command() -> Optional[List[str]]:
+    """
+    Finds a native command that copies its standard input to the clipboard.
+
+    Returns:
+        Optional[List[str]]: Command line to run, or None to fall back to pyperclip.
+    """
+    if sys.platform == 'darwin':
+        return ['pbcopy']
+    if sys.platform.startswith('linux'):
+        if os.environ.get('WAYLAND_DISPLAY') and shutil.which('wl-copy'):
+            return ['wl-copy']
+        if os.environ.get('DISPLAY') and shutil.which('xclip'):
+            return ['xclip', '-selection', 'clipboard']
+    return None
 
 
 def copy_to_clipboard(content: str) -> None:
     """
-    Copies the given content to the clipboard.
+    Copies the given content to the clipboard, piping it straight to the
+    platform's clipboard command when there is one.
 
     Args:
         content (str): Content to copy.
     """
     try:
-        pyperclip.copy(content)
+        command = _clipboard_command()
+        if command is not None:
+            subprocess.run(command, input=content.encode('utf-8'), check=True)
+        else:
+            # Imported lazily; only needed when no native command is available
+            import pyperclip
+            pyperclip.copy(content)
         print_info("The repository has been successfully copied to the clipboard.")
     except Exception as e:
         print_error(f"Error copying to clipboard: {e}")
 
 
-def write_output_file(content: str, output_path: str) -> None:
+def write_output_file(chunks: Iterable[str], output_path: str) -> Optional[str]:
     """
-    Writes the content to the specified output file.
+    Streams the content to the specified output file, keeping a copy for the
+    clipboard only while it stays under the clipboard size limit. If writing
+    fails before the limit is reached, the clipboard becomes the only
+    destination, so the rest of the content is kept regardless of the limit.
 
     Args:
-        content (str): Content to write.
+        chunks (Iterable[str]): Chunks of content to write.
         output_path (str): Path to the output file.
+
+    Returns:
+        Optional[str]: The full content, or None if it could not be kept.
     """
+    kept: Optional[List[str]] = []
+    kept_size = 0
+    write_failed = False
     try:
         with open(output_path, 'w', encoding='utf-8') as output_file:
-            output_file.write(content)
+            for chunk in chunks:
+                if kept is not None:
+                    kept_size += len(chunk)
+                    if kept_size > _CLIPBOARD_MAX_CHARS:
+                        kept = None
+                    else:
+                        kept.append(chunk)
+                output_file.write(chunk)
         print_info(f"The repository has been written to '{output_path}'.")
     except Exception as e:
         print_error(f"Error writing to output file: {e}")
+        write_failed = True
+        # Finish the remaining output; without the file, the clipboard
+        # gets all of it, ignoring the size limit
+        for chunk in chunks:
+            if kept is not None:
+                kept.append(chunk)
+
+    if kept is None:
+        if write_failed:
+            print_warning("Alert: Output is too large for the clipboard and the output file could not be written; "
+                          "nothing was saved.")
+        else:
+            print_warning("Alert: Output is too large for the clipboard; it was only written to the output file.")
+        return None
+    return ''.join(kept)